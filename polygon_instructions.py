@@ -13,7 +13,7 @@ UNIFIED INSTRUCTIONS - UPDATED
 #
 # Usage:
 #   - Set POLYGON_API_KEY in your .env file
-#   - pip install polygon-api-client python-dotenv aiohttp websocket-client pytz
+#   - pip install polygon-api-client python-dotenv aiohttp websocket-client pytz orjson aiolimiter Brotli uvloop
 #   - python polygon_api_unified_instructions.py
 # ==============================================================================
 
@@ -189,7 +189,7 @@ UNIFIED INSTRUCTIONS - UPDATED
 #        next_url = data.get('next_url')
 #        if not next_url:
 #            break
-#        url = f"{next_url}&apiKey={API_KEY}"
+#        url = next_url  # API key travels in the Authorization header
 #
 # 5. Data Validation:
 #    - Always check for None/zero values
@@ -213,7 +213,8 @@ UNIFIED INSTRUCTIONS - UPDATED
 # 3. Rate Limiting:
 #    - Monitor API usage
 #    - Use pagination for large requests
-#    - Consider implementing delays between requests
+#    - Throttle with a token bucket set just under your tier limit
+#      (see RATE_LIMITER in Section 3) instead of fixed sleeps
 #
 # 4. Data Validation:
 #    - Verify timestamps are in correct format
@@ -269,12 +270,69 @@ UNIFIED INSTRUCTIONS - UPDATED
 #
 # This script shows how to retrieve the *exact* option ticker symbol used by Polygon.io.
 # It avoids manual construction of option tickers, which can be error-prone.
+# Lookups are memoized per (underlying, expiration, strike, option_type) since a
+# contract's ticker never changes; call get_option_ticker.cache_clear() to evict.
 
+import functools
 import os
 from typing import Optional
 from dotenv import load_dotenv
 from polygon import RESTClient
 
+_REST_CLIENT: Optional[RESTClient] = None
+_REST_CLIENT_KEY: Optional[str] = None
+
+def _get_rest_client(api_key: Optional[str] = None) -> RESTClient:
+    """
+    Return the shared RESTClient, building it on first use or when the key changes.
+
+    With no api_key, keeps the current client's key, or falls back to
+    POLYGON_API_KEY from the environment if no client exists yet.
+    """
+    global _REST_CLIENT, _REST_CLIENT_KEY
+    if api_key is None:
+        api_key = _REST_CLIENT_KEY
+    if api_key is None:
+        load_dotenv()
+        api_key = os.getenv('POLYGON_API_KEY')
+        if not api_key:
+            raise ValueError("No API key provided and POLYGON_API_KEY not found in environment")
+    if _REST_CLIENT is None or _REST_CLIENT_KEY != api_key:
+        _REST_CLIENT = RESTClient(api_key)
+        _REST_CLIENT_KEY = api_key
+    return _REST_CLIENT
+
+@functools.lru_cache(maxsize=4096)
+def _lookup_option_ticker_cached(
+    underlying: str,
+    expiration: str,
+    strike: float,
+    option_type: str
+) -> str:
+    """
+    Query Polygon for the contract ticker. Results are cached; failures are not.
+
+    Uses the current shared client (see _get_rest_client).
+    """
+    client = _get_rest_client()
+    contracts = list(client.list_options_contracts(
+        underlying_ticker=underlying,
+        expiration_date=expiration,
+        strike_price=strike,
+        contract_type=option_type,
+        limit=1
+    ))
+
+    # Check if we found a matching contract
+    if not contracts:
+        raise ValueError(
+            f"No {option_type} contract found for {underlying} "
+            f"expiring {expiration} at strike {strike}"
+        )
+
+    # Return the ticker symbol
+    return contracts[0].ticker
+
 def get_option_ticker(
     underlying: str,
     expiration: str,
@@ -310,32 +368,20 @@ def get_option_ticker(
         if not api_key:
             raise ValueError("No API key provided and POLYGON_API_KEY not found in environment")
 
-    # Initialize client
-    client = RESTClient(api_key)
+    # Make this key the shared client's key; the lookup reuses that client
+    _get_rest_client(api_key)
 
     try:
-        # Query the API for matching contracts
-        contracts = list(client.list_options_contracts(
-            underlying_ticker=underlying,
-            expiration_date=expiration,
-            strike_price=strike,
-            contract_type=option_type.lower(),
-            limit=1
-        ))
-
-        # Check if we found a matching contract
-        if not contracts:
-            raise ValueError(
-                f"No {option_type} contract found for {underlying} "
-                f"expiring {expiration} at strike {strike}"
-            )
-
-        # Return the ticker symbol
-        return contracts[0].ticker
+        # Query the API (or the cache) for the matching contract
+        return _lookup_option_ticker_cached(
+            underlying, expiration, strike, option_type.lower()
+        )
 
     except Exception as e:
         raise RuntimeError(f"Error fetching option contract: {str(e)}")
 
+get_option_ticker.cache_clear = _lookup_option_ticker_cached.cache_clear
+
 
 # ==============================================================================
 # SECTION 3: ASYNC INSTRUCTIONS
@@ -350,13 +396,18 @@ def get_option_ticker(
 # Key Concepts:
 #  1. aiohttp for async HTTP requests
 #  2. asyncio for managing async operations
-#  3. Concurrent API calls using asyncio.gather()
-#  4. Session management with aiohttp.ClientSession
+#  3. Concurrent API calls using asyncio.gather(), bounded by a semaphore
+#     and a token-bucket rate limiter
+#  4. Session management with one shared aiohttp.ClientSession
 #  5. Error handling in async context
 
 import asyncio
+import re
 import aiohttp
+import orjson
+from aiolimiter import AsyncLimiter
 from datetime import datetime
+from urllib.parse import urlencode
 import pytz
 
 # Load environment variables again if needed
@@ -365,6 +416,108 @@ API_KEY = os.getenv('POLYGON_API_KEY')
 BASE_URL = "https://api.polygon.io"
 TIMEZONE = pytz.timezone('America/New_York')
 
+# Rate limiting
+# -------------
+# Set MAX_REQUESTS_PER_SECOND slightly below your subscription tier's limit
+# (e.g. 2.9 for a 3/s tier) to absorb clock skew between us and Polygon.
+# Staying just under the limit avoids 429s and the retry storms they cause.
+MAX_REQUESTS_PER_SECOND = 2.9
+MAX_CONCURRENT_REQUESTS = 32
+RATE_LIMITER = AsyncLimiter(max_rate=MAX_REQUESTS_PER_SECOND, time_period=1)
+
+# Shared HTTP session
+# -------------------
+# Polygon is a single HTTPS host, so one long-lived session with a pooled
+# connector lets every request after the first reuse an open TCP/TLS
+# connection. The API key is sent in the Authorization header rather than the
+# query string. The session is created lazily because aiohttp connectors must
+# be built inside a running event loop.
+#
+# Compression needs no setup here: aiohttp already sends Accept-Encoding
+# (gzip, deflate, plus br when Brotli is installed) and decompresses bodies.
+
+_SESSION: Optional[aiohttp.ClientSession] = None
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Return the shared aiohttp session, creating it on first use.
+
+    Must be called from inside a running event loop. Call close_session()
+    before the loop finishes (e.g. at the end of the coroutine passed to
+    asyncio.run).
+    """
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+        _SESSION = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={"Authorization": f"Bearer {API_KEY}"},
+            json_serialize=lambda obj: orjson.dumps(obj).decode()
+        )
+    return _SESSION
+
+async def close_session():
+    """
+    Close the shared aiohttp session if it is open.
+    """
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+
+# Suffixes that map Python keyword filters onto Polygon's range operators,
+# e.g. strike_price_gte=400 -> strike_price.gte=400
+_RANGE_SUFFIXES = ('_gte', '_gt', '_lte', '_lt')
+
+def _polygon_query_params(filters):
+    """
+    Convert keyword filters into Polygon query parameters, dropping None values.
+    """
+    params = {}
+    for key, value in filters.items():
+        if value is None:
+            continue
+        for suffix in _RANGE_SUFFIXES:
+            if key.endswith(suffix):
+                key = f"{key[:-len(suffix)]}.{suffix[1:]}"
+                break
+        params[key] = value
+    return params
+
+# Polygon option tickers follow OCC: O:<root><YYMMDD><C|P><strike x 1000, 8 digits>,
+# e.g. O:SPY250117C00400000
+_OCC_TICKER = re.compile(
+    r'^O:(?P<root>[A-Z0-9.]+?)(?P<date>\d{6})(?P<type>[CP])(?P<strike>\d{8})$'
+)
+
+def _contract_fields(contract):
+    """
+    Return (underlying, expiration_date, contract_type, strike_price) for a
+    contract dict, filling missing fields from its OCC ticker. Fields that
+    cannot be determined are None.
+    """
+    underlying = contract.get('underlying_ticker')
+    expiration = contract.get('expiration_date')
+    contract_type = contract.get('contract_type')
+    strike = contract.get('strike_price')
+    
+    match = _OCC_TICKER.match(contract.get('ticker') or '')
+    if match:
+        date = match.group('date')
+        underlying = underlying or match.group('root')
+        expiration = expiration or f"20{date[:2]}-{date[2:4]}-{date[4:]}"
+        contract_type = contract_type or ('call' if match.group('type') == 'C' else 'put')
+        if strike is None:
+            strike = int(match.group('strike')) / 1000
+    return underlying, expiration, contract_type, strike
+
 class AsyncPolygonClient:
     """
     Asynchronous client for Polygon.io API
@@ -374,11 +527,16 @@ class AsyncPolygonClient:
      2. Parallel async calls (asyncio.gather)
      3. Paginated requests
      4. Error handling and retries
+     5. Bounded concurrency and rate limiting
     """
     
-    def __init__(self, api_key):
+    def __init__(self, api_key, limiter=None, max_concurrency=MAX_CONCURRENT_REQUESTS):
         self.api_key = api_key
         self.base_url = BASE_URL
+        # Share the module limiter by default so every caller draws from
+        # the same per-second budget
+        self.limiter = limiter or RATE_LIMITER
+        self.semaphore = asyncio.Semaphore(max_concurrency)
     
     async def _make_request(self, session, url):
         """
@@ -386,14 +544,18 @@ class AsyncPolygonClient:
         
         Args:
             session (aiohttp.ClientSession): Open session for HTTP requests
-            url (str): Full API endpoint
+                (normally the shared one from get_session())
+            url (str): Full API endpoint, without the apiKey query parameter
         
         Returns:
             dict | None: JSON response data if successful, None otherwise
         """
+        # Per-request header so this client's key wins over the session default
+        headers = {"Authorization": f"Bearer {self.api_key}"}
         try:
-            async with session.get(url) as response:
-                data = await response.json()
+            async with session.get(url, headers=headers) as response:
+                # orjson parses the raw body much faster than the stdlib json
+                data = orjson.loads(await response.read())
                 if data.get('status') == 'OK':
                     return data.get('results')
                 return None
@@ -405,7 +567,7 @@ class AsyncPolygonClient:
         """
         Get the last trade for a given symbol.
         """
-        url = f"{self.base_url}/v2/last/trade/{symbol}?apiKey={self.api_key}"
+        url = f"{self.base_url}/v2/last/trade/{symbol}"
         result = await self._make_request(session, url)
         if result:
             return {
@@ -423,8 +585,7 @@ class AsyncPolygonClient:
             f"{self.base_url}/v3/reference/options/contracts?"
             f"underlying_ticker={symbol}&"
             f"expiration_date={expiry}&"
-            f"limit=1000&"
-            f"apiKey={self.api_key}"
+            f"limit=1000"
         )
         return await self._make_request(session, url)
     
@@ -434,34 +595,136 @@ class AsyncPolygonClient:
         """
         url = (
             f"{self.base_url}/v3/snapshot/options/{underlying}/"
-            f"{option_symbol}?apiKey={self.api_key}"
+            f"{option_symbol}"
         )
         return await self._make_request(session, url)
     
+    async def _make_paged_request(self, session, url):
+        """
+        Follow next_url across pages and collect every page's results.
+        
+        Each page waits for a concurrency slot and a rate token.
+        
+        Returns:
+            list: Combined results from every page fetched successfully
+        """
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        all_results = []
+        while url:
+            try:
+                async with self.semaphore, self.limiter:
+                    async with session.get(url, headers=headers) as response:
+                        data = orjson.loads(await response.read())
+            except Exception as e:
+                print(f"Error making request: {str(e)}")
+                break
+            if data.get('status') != 'OK':
+                break
+            all_results.extend(data.get('results', []))
+            url = data.get('next_url')
+        return all_results
+    
+    async def get_chain_snapshot(self, session, underlying, **filters):
+        """
+        Get snapshots for a whole option chain in one paginated request.
+        
+        Filters are Polygon query parameters; use a _gte/_gt/_lte/_lt suffix
+        for ranges, e.g. expiration_date_gte="2025-01-17",
+        strike_price_lte=600, contract_type="call".
+        """
+        params = {'limit': 250}  # Maximum page size for this endpoint
+        params.update(_polygon_query_params(filters))
+        url = (
+            f"{self.base_url}/v3/snapshot/options/{underlying}?"
+            f"{urlencode(params)}"
+        )
+        return await self._make_paged_request(session, url)
+    
+    async def _throttled_snapshot(self, session, underlying, option_symbol):
+        """
+        Fetch one snapshot once a concurrency slot and a rate token are free.
+        """
+        async with self.semaphore, self.limiter:
+            return await self.get_option_snapshot(session, underlying, option_symbol)
+    
     async def get_multiple_snapshots(self, session, contracts):
         """
-        Get snapshots for multiple contracts in parallel.
+        Get snapshots for multiple contracts.
+        
+        Contracts are grouped by (underlying, expiration_date, contract_type),
+        with missing fields read from the OCC ticker. Each group of two or
+        more is fetched with one get_chain_snapshot call narrowed to that
+        expiry, type and strike range. Single contracts, and contracts whose
+        fields cannot be determined, fall back to per-ticker snapshot calls.
+        Results keep the order of `contracts`.
         """
-        tasks = []
+        # contract dict typically has 'underlying_ticker' and 'ticker'
+        groups = {}
+        per_ticker = []
         for contract in contracts:
-            # contract dict typically has 'underlying_ticker' and 'ticker'
-            task = self.get_option_snapshot(
+            underlying, expiration, contract_type, strike = _contract_fields(contract)
+            if underlying and expiration and contract_type and strike is not None:
+                key = (underlying, expiration, contract_type)
+                groups.setdefault(key, []).append((contract, strike))
+            else:
+                per_ticker.append((underlying, contract.get('ticker')))
+        
+        chain_tasks = []
+        for (underlying, expiration, contract_type), members in groups.items():
+            if len(members) == 1:
+                # One snapshot request beats a chain page for a lone contract
+                per_ticker.append((underlying, members[0][0].get('ticker')))
+                continue
+            strikes = [strike for _, strike in members]
+            chain_tasks.append(self.get_chain_snapshot(
                 session,
-                contract.get('underlying_ticker'),
-                contract.get('ticker')
-            )
-            tasks.append(task)
+                underlying,
+                expiration_date=expiration,
+                contract_type=contract_type,
+                strike_price_gte=min(strikes),
+                strike_price_lte=max(strikes)
+            ))
+        
+        # Parallel execution, still bounded by the semaphore and limiter
+        chains, singles = await asyncio.gather(
+            asyncio.gather(*chain_tasks),
+            asyncio.gather(*[
+                self._throttled_snapshot(session, underlying, ticker)
+                for underlying, ticker in per_ticker
+            ])
+        )
+        
+        snapshots_by_ticker = {}
+        for chain in chains:
+            for snapshot in chain:
+                snapshots_by_ticker[snapshot.get('details', {}).get('ticker')] = snapshot
+        for (_, ticker), snapshot in zip(per_ticker, singles):
+            if snapshot is not None:
+                snapshots_by_ticker[ticker] = snapshot
         
-        # Parallel execution
-        results = await asyncio.gather(*tasks)
-        return [r for r in results if r is not None]
+        return [
+            snapshots_by_ticker[contract.get('ticker')]
+            for contract in contracts
+            if contract.get('ticker') in snapshots_by_ticker
+        ]
 
 
+def run_async(coro):
+    """
+    Run a coroutine on uvloop's event loop when uvloop is installed
+    (it is not available on Windows), otherwise on the default asyncio loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
 async def run_async_example():
     """
     Example usage of the AsyncPolygonClient.
     Demonstrates:
-     - Creating a single aiohttp session
+     - Reusing the shared aiohttp session
      - Making single and parallel async requests
     """
     if not API_KEY:
@@ -470,7 +733,8 @@ async def run_async_example():
     
     client = AsyncPolygonClient(API_KEY)
 
-    async with aiohttp.ClientSession() as session:
+    session = get_session()
+    try:
         print("\n1. Getting last trade for SPY...")
         trade = await client.get_last_trade(session, "SPY")
         if trade:
@@ -484,14 +748,23 @@ async def run_async_example():
         if contracts:
             print(f"Found {len(contracts)} contracts")
             
+            print("\n2b. Getting the SPY call chain snapshot for that expiry...")
+            chain = await client.get_chain_snapshot(
+                session, "SPY", expiration_date=expiry, contract_type="call"
+            )
+            if chain:
+                print(f"Chain snapshot returned {len(chain)} calls")
+            
             print("\n3. Getting snapshots for first 5 contracts...")
             snapshots = await client.get_multiple_snapshots(session, contracts[:5])
             for snapshot in snapshots:
-                print(f"Contract: {snapshot['ticker']}")
+                print(f"Contract: {snapshot['details']['ticker']}")
                 if 'last_quote' in snapshot:
                     print(f"Ask: ${snapshot['last_quote']['ask']:.2f}")
                     print(f"Bid: ${snapshot['last_quote']['bid']:.2f}")
                 print("---")
+    finally:
+        await close_session()
 
 
 # ==============================================================================
@@ -524,7 +797,7 @@ def on_message(ws, message):
     Handle incoming messages from the WebSocket connection.
     """
     try:
-        data = json.loads(message)
+        data = orjson.loads(message)
         print(f"Received: {data}")
         
         # Handle different message types
@@ -622,7 +895,7 @@ if __name__ == "__main__":
 
     # Example 2: Run async calls (Stocks & Options)
     # ---------------------------------------------
-    # asyncio.run(run_async_example())
+    # run_async(run_async_example())
 
     # Example 3: Run WebSocket Example
     # --------------------------------
@@ -634,12 +907,21 @@ SPY Options Expiry Dates Fetcher
 
 This script fetches all SPY option expiry dates between Jan 24, 2025 and Dec 19, 2025
 using the Polygon.io API reference endpoint.
+
+Progress is cached in ~/.polygon_cache/expiries-{SYMBOL}.json: the dates found
+so far plus the next pagination cursor. A run within CACHE_TTL_SECONDS of the
+last write resumes from that cursor (or skips the API entirely if the previous
+walk finished); older caches are ignored and the walk starts from page 1.
 """
 
+import json
 import os
+import tempfile
+import time
 import asyncio
 import aiohttp
-from datetime import datetime
+import orjson
+from aiolimiter import AsyncLimiter
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -651,54 +933,140 @@ SYMBOL = "SPY"
 START_DATE = "2025-01-24"
 END_DATE = "2025-12-19"
 BASE_URL = "https://api.polygon.io"
+# Keep just under the tier's per-second limit (see Section 3)
+MAX_REQUESTS_PER_SECOND = 2.9
+RATE_LIMITER = AsyncLimiter(max_rate=MAX_REQUESTS_PER_SECOND, time_period=1)
+CACHE_DIR = os.path.expanduser("~/.polygon_cache")
+CACHE_TTL_SECONDS = 60 * 60
+
+def _load_expiry_cache(path, query):
+    """Return (expiry_dates, next_url) from a fresh cache for `query`, else None."""
+    try:
+        if time.time() - os.path.getmtime(path) > CACHE_TTL_SECONDS:
+            return None
+        with open(path) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if state.get('query') != query:
+        return None
+    return set(state.get('expiry_dates', [])), state.get('next_url')
+
+def _save_expiry_cache(path, query, expiry_dates, next_url):
+    """Atomically write the pagination state; failures only print a warning."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({
+                    'query': query,
+                    'expiry_dates': sorted(expiry_dates),
+                    'next_url': next_url
+                }, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"Warning: could not write cache {path}: {e}")
+
+async def get_expiry_dates(session):
+    """Fetch all option expiry dates for SPY within the specified range.
 
-async def get_expiry_dates():
-    """Fetch all option expiry dates for SPY within the specified range"""
+    `session` should carry the Authorization header (see main()); every page
+    is fetched over its pooled connections.
+    """
     
     expiry_dates = set()
-    next_url = (f"{BASE_URL}/v3/reference/options/contracts?"
-                f"underlying_ticker={SYMBOL}&"
-                f"expired=false&"
-                f"limit=1000&"  # Maximum limit to get all dates
-                f"apiKey={API_KEY}")
+    first_url = (f"{BASE_URL}/v3/reference/options/contracts?"
+                 f"underlying_ticker={SYMBOL}&"
+                 f"expired=false&"
+                 f"limit=1000")  # Maximum limit to get all dates
+    next_url = first_url
+    
+    # Resume from a fresh cache of the same query and date range, if any
+    cache_path = os.path.join(CACHE_DIR, f"expiries-{SYMBOL}.json")
+    cache_query = f"{first_url}|{START_DATE}|{END_DATE}"
+    cached = _load_expiry_cache(cache_path, cache_query)
+    resuming = False
+    if cached is not None:
+        expiry_dates, next_url = cached
+        resuming = next_url is not None
+    
+    # YYYY-MM-DD strings sort chronologically, so the range check compares
+    # them directly instead of parsing every date with strptime
+    start_date = START_DATE
+    end_date = END_DATE
     
     try:
-        async with aiohttp.ClientSession() as session:
-            while next_url:
-                async with session.get(next_url) as response:
-                    data = await response.json()
-                    
-                    if data.get('status') != 'OK':
-                        print(f"Error: API returned status {data.get('status')}")
-                        return
-                    
-                    # Extract unique expiry dates within our range
-                    start_date = datetime.strptime(START_DATE, "%Y-%m-%d")
-                    end_date = datetime.strptime(END_DATE, "%Y-%m-%d")
-                    
-                    for contract in data.get('results', []):
-                        expiry = contract.get('expiration_date')
-                        if expiry:
-                            expiry_date = datetime.strptime(expiry, "%Y-%m-%d")
-                            if start_date <= expiry_date <= end_date:
-                                expiry_dates.add(expiry)
-                    
-                    # Check if there are more pages
-                    next_url = data.get('next_url')
-                    if next_url:
-                        next_url = f"{next_url}&apiKey={API_KEY}"
+        while next_url:
+            # Stay under the tier's rate limit
+            await RATE_LIMITER.acquire()
+            async with session.get(next_url) as response:
+                data = orjson.loads(await response.read())
+                
+                if data.get('status') != 'OK':
+                    if resuming:
+                        # The stored cursor may have expired; drop the cache
+                        # and walk again from page 1 rather than failing on
+                        # the same cursor until the TTL runs out
+                        print(f"Cached cursor rejected (status {data.get('status')}); restarting")
+                        try:
+                            os.remove(cache_path)
+                        except OSError:
+                            pass
+                        expiry_dates, next_url, resuming = set(), first_url, False
+                        continue
+                    print(f"Error: API returned status {data.get('status')}")
+                    return
+                # The stored cursor worked; later cursors come from this run
+                resuming = False
+                
+                # Extract unique expiry dates within our range
+                for contract in data.get('results', []):
+                    expiry = contract.get('expiration_date')
+                    if expiry and start_date <= expiry <= end_date:
+                        expiry_dates.add(expiry)
+                
+                # Check if there are more pages (the Authorization header
+                # carries the API key, so next_url is used as-is)
+                next_url = data.get('next_url')
             
-            # Sort and print the dates after all pages are processed
-            sorted_dates = sorted(list(expiry_dates))
+            _save_expiry_cache(cache_path, cache_query, expiry_dates, next_url)
+        
+        # Sort and print the dates after all pages are processed
+        sorted_dates = sorted(list(expiry_dates))
+        
+        print(f"\nSPY Option Expiry Dates between {START_DATE} and {END_DATE}:")
+        print("=" * 50)
+        for date in sorted_dates:
+            print(date)
+        print(f"\nTotal expiry dates found: {len(sorted_dates)}")
             
-            print(f"\nSPY Option Expiry Dates between {START_DATE} and {END_DATE}:")
-            print("=" * 50)
-            for date in sorted_dates:
-                print(date)
-            print(f"\nTotal expiry dates found: {len(sorted_dates)}")
-                
     except Exception as e:
         print(f"Error fetching data: {str(e)}")
 
+async def main():
+    # One pooled session for the whole walk so each page reuses the open
+    # TLS connection; the API key goes in the header, not the URL
+    connector = aiohttp.TCPConnector(
+        limit_per_host=32,
+        ttl_dns_cache=300,
+        keepalive_timeout=75
+    )
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=30),
+        headers={"Authorization": f"Bearer {API_KEY}"}
+    ) as session:
+        await get_expiry_dates(session)
+
 if __name__ == "__main__":
-    asyncio.run(get_expiry_dates()) 
+    # Prefer uvloop's event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())